@@ -4,20 +4,86 @@ This file handles mocking of problematic dependencies that may not
 install correctly in all environments (e.g., ed25519 on Python 3.12).
 """
 
+import importlib.util
+import os
 import sys
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock
 
-# Mock problematic modules before they're imported
-# ed25519 has compatibility issues with Python 3.12
-sys.modules["ed25519"] = MagicMock()
+import pytest
 
-# py_near and its submodules
-sys.modules["py_near"] = MagicMock()
-sys.modules["py_near.account"] = MagicMock()
-sys.modules["py_near.transactions"] = MagicMock()
-sys.modules["py_near.dapps"] = MagicMock()
-sys.modules["py_near.dapps.core"] = MagicMock()
+# Modules replaced with mocks before any test module is collected.
+# ed25519 has compatibility issues with Python 3.12; py_near and
+# calimero_client_py pull in native extensions the unit tests never need.
+MOCKED_MODULES = (
+    "ed25519",
+    "py_near",
+    "py_near.account",
+    "py_near.durable_nonce",
+    "py_near.transactions",
+    "py_near.dapps",
+    "py_near.dapps.core",
+    "calimero_client_py",
+    "calimero_client_py.client",
+)
 
-# calimero_client_py and its submodules
-sys.modules["calimero_client_py"] = MagicMock()
-sys.modules["calimero_client_py.client"] = MagicMock()
+
+_module_patch = pytest.MonkeyPatch()
+
+
+def pytest_configure(config):
+    """Install the dependency mocks once per process.
+
+    Runs before collection, so under pytest-xdist every worker installs
+    the mocks before it imports any test module. Test modules must not
+    patch these entries themselves.
+    """
+    for name in MOCKED_MODULES:
+        _module_patch.setitem(sys.modules, name, MagicMock())
+
+
+def pytest_unconfigure(config):
+    """Restore whatever the mocked ``sys.modules`` entries held before."""
+    _module_patch.undo()
+
+
+_CACHED_CONFIG = None
+
+
+def _load_config():
+    """Load the bootstrap config module with mocked dependencies, once.
+
+    The module is loaded straight from its file so the package import
+    chain is skipped. ``spec_from_file_location`` bypasses the import
+    cache, so the result is memoized here for every caller in the process.
+    """
+    global _CACHED_CONFIG
+    if _CACHED_CONFIG is not None:
+        return _CACHED_CONFIG
+
+    utils_mock = ModuleType("merobox.commands.utils")
+    utils_mock.console = SimpleNamespace(print=lambda *args, **kwargs: None)
+
+    config_path = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "commands",
+        "bootstrap",
+        "config.py",
+    )
+    # config.py binds the console at import time, so the stub only needs to
+    # be in sys.modules while loading and must not leak into other modules.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "merobox.commands.utils", utils_mock)
+        spec = importlib.util.spec_from_file_location("config", config_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+    _CACHED_CONFIG = module
+    return module
+
+
+@pytest.fixture(scope="session")
+def config_module():
+    """The bootstrap config module loaded by ``_load_config``."""
+    return _load_config()
@@ -45,6 +45,7 @@ def _capture_run_config_factory(container_configs):
     return capture_run_config
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_docker_container_uses_cap_add_not_privileged(mock_docker):
     """Test that containers use specific capabilities instead of privileged mode."""
@@ -140,6 +141,7 @@ def test_docker_manager_signal_handlers_disabled(mock_docker):
     assert manager._original_sigterm_handler is None
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_docker_manager_cleanup_resources(mock_docker):
     """Test that _cleanup_resources stops all managed containers."""
@@ -193,6 +195,7 @@ def test_docker_manager_remove_signal_handlers(mock_docker):
     assert signal.getsignal(signal.SIGTERM) == original_sigterm
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_docker_manager_cleanup_prevents_double_cleanup(mock_docker):
     """Test that _cleanup_resources prevents double cleanup races."""
@@ -222,6 +225,7 @@ def test_docker_manager_cleanup_prevents_double_cleanup(mock_docker):
     assert mock_container2.stop.call_count == 0
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_docker_manager_cleanup_concurrent_access(mock_docker):
     """Test that _cleanup_resources handles concurrent access correctly.
@@ -279,6 +283,7 @@ def test_docker_manager_cleanup_concurrent_access(mock_docker):
     assert in_progress_count == 0, f"Expected 0 IN_PROGRESS, got {in_progress_count}"
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_docker_manager_cleanup_returns_in_progress_when_flag_set(mock_docker):
     """Test that cleanup returns IN_PROGRESS when _cleanup_in_progress flag is set.
@@ -314,6 +319,7 @@ def test_docker_manager_cleanup_returns_in_progress_when_flag_set(mock_docker):
 # ============================================================================
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_cleanup_on_exit_tears_down_by_default(mock_docker):
     """By default the atexit handler stops every managed container."""
@@ -330,6 +336,7 @@ def test_cleanup_on_exit_tears_down_by_default(mock_docker):
     assert manager.nodes == {}
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_keep_resources_on_exit_skips_atexit_teardown(mock_docker):
     """keep_resources_on_exit() makes the atexit handler a no-op.
@@ -357,6 +364,7 @@ def test_keep_resources_on_exit_skips_atexit_teardown(mock_docker):
     assert manager.nodes == {}
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_keep_resources_on_exit_does_not_block_signal_cleanup(mock_docker):
     """keep_resources_on_exit() only suppresses atexit, not SIGINT/SIGTERM."""
@@ -554,6 +562,7 @@ def test_graceful_stop_containers_batch_sends_sigterm_to_all_first(mock_docker):
 # ============================================================================
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_cors_uses_explicit_origins_not_wildcard(mock_docker):
     """Test that CORS configuration uses explicit origins instead of wildcard."""
@@ -610,6 +619,7 @@ def test_cors_uses_explicit_origins_not_wildcard(mock_docker):
     assert "http://127.0.0.1" in cors_origins
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_cors_custom_origins_are_used(mock_docker):
     """Test that custom CORS origins can be specified."""
@@ -670,6 +680,7 @@ def test_cors_custom_origins_are_used(mock_docker):
     assert "http://localhost:3000" not in cors_origins
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_cors_uses_explicit_headers_not_wildcard(mock_docker):
     """Test that CORS uses explicit headers instead of wildcard for credentials."""
@@ -719,6 +730,7 @@ def test_cors_uses_explicit_headers_not_wildcard(mock_docker):
     assert labels[cors_headers_key] == CORS_ALLOWED_HEADERS
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_cors_origins_propagated_to_auth_service(mock_docker):
     """Test that CORS origins are correctly propagated to auth service stack."""
@@ -860,6 +872,7 @@ def test_ensure_cluster_network_returns_none_on_failure(mock_docker):
     assert manager._ensure_cluster_network() is None
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_run_node_attaches_to_given_network(mock_docker):
     """run_node(network=...) attaches the run container to that network."""
@@ -878,6 +891,7 @@ def test_run_node_attaches_to_given_network(mock_docker):
     assert main_configs and main_configs[0].get("network") == "merobox-cluster"
 
 
+@pytest.mark.slow
 @patch("docker.from_env")
 def test_run_node_auth_network_wins_over_cluster_network(mock_docker):
     """When auth is enabled, the auth web network takes precedence over `network`."""
@@ -917,6 +931,7 @@ def _setup_mock_cluster(manager, mock_read_peer_id, nodes, network="merobox-clus
     return peer_ids, ips, config_files
 
 
+@pytest.mark.slow
 @patch("merobox.commands.manager.apply_bootstrap_nodes")
 @patch("merobox.commands.manager.read_peer_id")
 @patch("docker.from_env")
@@ -970,6 +985,7 @@ def test_wire_cluster_bootstrap_peers_bails_when_too_few_endpoints(
     mock_apply_bootstrap.assert_not_called()
 
 
+@pytest.mark.slow
 @patch("merobox.commands.manager.apply_bootstrap_nodes")
 @patch("merobox.commands.manager.read_peer_id")
 @patch("docker.from_env")
@@ -93,6 +93,7 @@ def _run_docker_node(mock_tee):
     return main_configs[0]["command"]
 
 
+@pytest.mark.slow
 def test_docker_command_includes_mock_tee_when_true():
     command = _run_docker_node(mock_tee=True)
     assert "--mock-tee" in command
@@ -100,6 +101,7 @@ def test_docker_command_includes_mock_tee_when_true():
     assert command.index("--mock-tee") > command.index("run")
 
 
+@pytest.mark.slow
 def test_docker_command_omits_mock_tee_when_false():
     command = _run_docker_node(mock_tee=False)
     assert "--mock-tee" not in command
@@ -1,44 +1,59 @@
-import asyncio
-from unittest.mock import MagicMock
+from merobox.commands.bootstrap.steps.stop_node import StopNodeStep
 
-import docker
 
-from merobox.commands.bootstrap.steps.stop_node import StopNodeStep
+class _FakeAPIError(Exception):
+    """Stand-in for docker.errors.APIError; the step treats any error alike."""
+
+
+class _FakeMgr:
+    """Minimal node manager recording the calls StopNodeStep makes."""
+
+    def __init__(self, stop_ret, running_ret=None, running_exc=None):
+        self.stop_ret = stop_ret
+        self.running_ret = running_ret
+        self.running_exc = running_exc
+        self.stop_calls = []
+        self.running_calls = []
+
+    def stop_node(self, node_name):
+        self.stop_calls.append(node_name)
+        return self.stop_ret
+
+    def is_node_running(self, node_name):
+        self.running_calls.append(node_name)
+        if self.running_exc is not None:
+            raise self.running_exc
+        return self.running_ret
 
 
-def test_stop_node_step_treats_confirmed_stopped_node_as_success():
-    manager = MagicMock()
-    manager.stop_node.return_value = False
-    manager.is_node_running.return_value = False
+async def test_stop_node_step_treats_confirmed_stopped_node_as_success():
+    manager = _FakeMgr(stop_ret=False, running_ret=False)
 
     step = StopNodeStep({"type": "stop_node", "nodes": ["node-1"]}, manager=manager)
-    result = asyncio.run(step.execute({}, {}))
+    result = await step.execute({}, {})
 
     assert result is True
-    manager.stop_node.assert_called_once_with("node-1")
-    manager.is_node_running.assert_called_once_with("node-1")
+    assert manager.stop_calls == ["node-1"]
+    assert manager.running_calls == ["node-1"]
 
 
-def test_stop_node_step_fails_when_status_check_is_unknown():
-    manager = MagicMock()
-    manager.stop_node.return_value = False
-    manager.is_node_running.side_effect = docker.errors.APIError("permission denied")
+async def test_stop_node_step_fails_when_status_check_is_unknown():
+    manager = _FakeMgr(stop_ret=False, running_exc=_FakeAPIError("permission denied"))
 
     step = StopNodeStep({"type": "stop_node", "nodes": ["node-1"]}, manager=manager)
-    result = asyncio.run(step.execute({}, {}))
+    result = await step.execute({}, {})
 
     assert result is False
-    manager.stop_node.assert_called_once_with("node-1")
-    manager.is_node_running.assert_called_once_with("node-1")
+    assert manager.stop_calls == ["node-1"]
+    assert manager.running_calls == ["node-1"]
 
 
-def test_stop_node_step_does_not_check_status_after_successful_stop():
-    manager = MagicMock()
-    manager.stop_node.return_value = True
+async def test_stop_node_step_does_not_check_status_after_successful_stop():
+    manager = _FakeMgr(stop_ret=True)
 
     step = StopNodeStep({"type": "stop_node", "nodes": ["node-1"]}, manager=manager)
-    result = asyncio.run(step.execute({}, {}))
+    result = await step.execute({}, {})
 
     assert result is True
-    manager.stop_node.assert_called_once_with("node-1")
-    manager.is_node_running.assert_not_called()
+    assert manager.stop_calls == ["node-1"]
+    assert manager.running_calls == []
@@ -4,145 +4,192 @@ This test module uses a conftest fixture to load the config module
 while avoiding import chain issues with external dependencies.
 """
 
-import importlib.util
-import os
-import sys
-import tempfile
-from types import ModuleType
-from unittest.mock import MagicMock
-
 import pytest
 
+_VALID_YAML = """
+name: Test Workflow
+nodes:
+  count: 2
+  prefix: calimero-node
+steps:
+  - name: Wait
+    type: wait
+    seconds: 5
+"""
 
-@pytest.fixture(scope="module")
-def config_module():
-    """Load the config module with mocked dependencies."""
-    # Create a simple mock for the console
-    console_mock = MagicMock()
-    console_mock.print = lambda *args, **kwargs: None
-
-    # Create a utils module mock
-    utils_mock = ModuleType("merobox.commands.utils")
-    utils_mock.console = console_mock
-
-    # Store original modules
-    original_modules = {}
-    modules_to_mock = ["merobox.commands.utils"]
-    for mod_name in modules_to_mock:
-        original_modules[mod_name] = sys.modules.get(mod_name)
-        sys.modules[mod_name] = utils_mock
-
-    try:
-        # Load the config module directly
-        config_path = os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "..",
-            "commands",
-            "bootstrap",
-            "config.py",
-        )
-        spec = importlib.util.spec_from_file_location("config", config_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        yield module
-    finally:
-        # Restore original modules
-        for mod_name, original in original_modules.items():
-            if original is None:
-                sys.modules.pop(mod_name, None)
-            else:
-                sys.modules[mod_name] = original
-
-
-class TestValidateWorkflowStep:
-    """Tests for validate_workflow_step function."""
-
-    def test_valid_install_application_step(self, config_module):
-        """Test validation of a valid install_application step."""
-        step = {
-            "name": "Install App",
-            "type": "install_application",
-            "node": "calimero-node-1",
-            "path": "./app.wasm",
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
+_INVALID_STEP_YAML = """
+name: Workflow with Issues
+nodes:
+  count: 2
+steps:
+  - name: Invalid Step
+    type: nonexistent_type
+"""
 
-    def test_valid_create_context_step(self, config_module):
-        """Test validation of a valid create_context step."""
-        step = {
-            "name": "Create Context",
-            "type": "create_context",
-            "node": "calimero-node-1",
-            "application_id": "{{app_id}}",
-            "group_id": "{{namespace_id}}",
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
+_MALFORMED_YAML = """
+name: Test
+nodes: [
+  invalid yaml here
+"""
 
-    def test_valid_call_step(self, config_module):
-        """Test validation of a valid call step."""
-        step = {
-            "name": "Execute Call",
-            "type": "call",
-            "node": "calimero-node-1",
-            "context_id": "{{context_id}}",
-            "method": "set",
-            "args": {"key": "value"},
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
+_EXPECTED_STEP_TYPES = frozenset(
+    {
+        "install_application",
+        "create_context",
+        "create_namespace",
+        "create_namespace_invitation",
+        "join_namespace",
+        "create_identity",
+        # Deprecated aliases kept valid
+        "create_group",
+        "create_group_invitation",
+        "join_group",
+        "invite",
+        "invite_identity",
+        "join_context",
+        "invite_open",
+        "join",
+        "join_open",
+        "list_namespaces",
+        "get_namespace_identity",
+        "create_group_in_namespace",
+        "list_namespace_groups",
+        "reparent_group",
+        "list_subgroups",
+        "add_group_members",
+        "call",
+        "wait",
+        "wait_for_sync",
+        "repeat",
+        "parallel",
+        "script",
+        "assert",
+        "json_assert",
+        "get_proposal",
+        "list_proposals",
+        "get_proposal_approvers",
+        "upload_blob",
+        "create_mesh",
+        "fuzzy_test",
+    }
+)
+
+
+def _step(type_, name="Test Step", **fields):
+    """Build a step config dict of the given type."""
+    return {"name": name, "type": type_, **fields}
+
+
+_VALID_STEPS = [
+    pytest.param(
+        _step("install_application", node="calimero-node-1", path="./app.wasm"),
+        id="install_application",
+    ),
+    pytest.param(
+        _step(
+            "create_context",
+            node="calimero-node-1",
+            application_id="{{app_id}}",
+            group_id="{{namespace_id}}",
+        ),
+        id="create_context",
+    ),
+    pytest.param(
+        _step(
+            "call",
+            node="calimero-node-1",
+            context_id="{{context_id}}",
+            method="set",
+            args={"key": "value"},
+        ),
+        id="call",
+    ),
+    pytest.param(_step("wait", seconds=5), id="wait"),
+    pytest.param(
+        _step(
+            "wait_for_sync",
+            context_id="{{context_id}}",
+            nodes=["calimero-node-1", "calimero-node-2"],
+            timeout=60,
+        ),
+        id="wait_for_sync",
+    ),
+    pytest.param(
+        _step("repeat", count=3, steps=[_step("wait", seconds=1)]),
+        id="repeat",
+    ),
+    pytest.param(
+        _step("script", script="./test.sh", target="nodes"),
+        id="script",
+    ),
+    # invite_identity alias validates with namespace_id
+    pytest.param(
+        _step(
+            "invite_identity",
+            node="calimero-node-1",
+            namespace_id="{{namespace_id}}",
+        ),
+        id="invite_identity",
+    ),
+    # join_context (group membership) needs only node and context_id
+    pytest.param(
+        _step("join_context", node="calimero-node-2", context_id="{{context_id}}"),
+        id="join_context",
+    ),
+]
+
+# (step, substring expected in at least one lower-cased error)
+_INVALID_STEPS = [
+    pytest.param(
+        _step("install_application", path="./app.wasm"),
+        "node",
+        id="missing_node",
+    ),
+    pytest.param(
+        _step("install_application", node="calimero-node-1"),
+        "path",
+        id="missing_path",
+    ),
+    pytest.param(
+        _step("wait", seconds=-5),
+        "seconds",
+        id="negative_wait_seconds",
+    ),
+    pytest.param(
+        _step("ws_connect", node="calimero-node-1", timeout=-1),
+        "timeout",
+        id="ws_connect_non_positive_timeout",
+    ),
+    pytest.param(
+        _step("repeat", count=2, steps=[_step("invalid_type")]),
+        "invalid_type",
+        id="nested_repeat_step",
+    ),
+    pytest.param(
+        _step(
+            "parallel",
+            groups=[{"name": "Group 1", "steps": [_step("invalid_type")]}],
+        ),
+        "invalid_type",
+        id="nested_parallel_step",
+    ),
+]
 
-    def test_valid_wait_step(self, config_module):
-        """Test validation of a valid wait step."""
-        step = {
-            "name": "Wait",
-            "type": "wait",
-            "seconds": 5,
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
 
-    def test_valid_wait_for_sync_step(self, config_module):
-        """Test validation of a valid wait_for_sync step."""
-        step = {
-            "name": "Wait for Sync",
-            "type": "wait_for_sync",
-            "context_id": "{{context_id}}",
-            "nodes": ["calimero-node-1", "calimero-node-2"],
-            "timeout": 60,
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
+class TestValidateWorkflowStep:
+    """Tests for validate_workflow_step function."""
 
-    def test_valid_repeat_step(self, config_module):
-        """Test validation of a valid repeat step."""
-        step = {
-            "name": "Repeat",
-            "type": "repeat",
-            "count": 3,
-            "steps": [
-                {
-                    "name": "Wait",
-                    "type": "wait",
-                    "seconds": 1,
-                }
-            ],
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
+    @pytest.mark.parametrize("step", _VALID_STEPS)
+    def test_valid_step(self, config_module, step):
+        """Test that well-formed steps validate without errors."""
+        assert config_module.validate_workflow_step(step, 0) == []
 
-    def test_valid_script_step(self, config_module):
-        """Test validation of a valid script step."""
-        step = {
-            "name": "Run Script",
-            "type": "script",
-            "script": "./test.sh",
-            "target": "nodes",
-        }
+    @pytest.mark.parametrize("step, expected", _INVALID_STEPS)
+    def test_invalid_step(self, config_module, step, expected):
+        """Test that malformed steps report an error naming the problem."""
         errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
+        assert len(errors) > 0
+        assert any(expected in err.lower() for err in errors)
 
     def test_valid_login_step(self, config_module):
         """Test validation of a valid login step."""
@@ -188,17 +235,6 @@ class TestValidateWorkflowStep:
         assert config_module.validate_workflow_step(positive, 0) == []
         assert config_module.validate_workflow_step(negative, 0) == []
 
-    def test_ws_connect_rejects_non_positive_timeout(self, config_module):
-        """Test that ws_connect rejects a non-positive timeout."""
-        step = {
-            "name": "WS bad timeout",
-            "type": "ws_connect",
-            "node": "calimero-node-1",
-            "timeout": -1,
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert any("timeout" in err.lower() for err in errors)
-
     def test_call_step_accepts_unauthenticated_flag(self, config_module):
         """Test that the call step accepts the negative-auth flags."""
         step = {
@@ -235,76 +271,6 @@ class TestValidateWorkflowStep:
         assert "Invalid step type" in errors[0]
         assert "invalid_step_type" in errors[0]
 
-    def test_missing_required_field_node(self, config_module):
-        """Test that missing required 'node' field is detected."""
-        step = {
-            "name": "Missing Node",
-            "type": "install_application",
-            "path": "./app.wasm",
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) > 0
-        assert any("node" in err.lower() for err in errors)
-
-    def test_missing_required_field_path(self, config_module):
-        """Test that missing required 'path' field is detected."""
-        step = {
-            "name": "Missing Path",
-            "type": "install_application",
-            "node": "calimero-node-1",
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) > 0
-        assert any("path" in err.lower() for err in errors)
-
-    def test_invalid_wait_seconds_negative(self, config_module):
-        """Test that negative seconds in wait step is detected."""
-        step = {
-            "name": "Invalid Wait",
-            "type": "wait",
-            "seconds": -5,
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) > 0
-
-    def test_nested_repeat_step_validation(self, config_module):
-        """Test validation of nested steps in repeat."""
-        step = {
-            "name": "Repeat with Invalid Nested",
-            "type": "repeat",
-            "count": 2,
-            "steps": [
-                {
-                    "name": "Invalid Step",
-                    "type": "invalid_type",
-                }
-            ],
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) > 0
-        assert any("invalid_type" in err.lower() for err in errors)
-
-    def test_nested_parallel_step_validation(self, config_module):
-        """Test validation of nested steps in parallel groups."""
-        step = {
-            "name": "Parallel with Invalid Nested",
-            "type": "parallel",
-            "groups": [
-                {
-                    "name": "Group 1",
-                    "steps": [
-                        {
-                            "name": "Invalid Step",
-                            "type": "invalid_type",
-                        }
-                    ],
-                }
-            ],
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) > 0
-        assert any("invalid_type" in err.lower() for err in errors)
-
 
 class TestValidateWorkflowConfig:
     """Tests for validate_workflow_config function."""
@@ -447,92 +413,49 @@ class TestFormatValidationErrors:
 class TestLoadWorkflowConfig:
     """Tests for load_workflow_config function with schema validation."""
 
-    def test_load_valid_config(self, config_module):
+    def test_load_valid_config(self, config_module, tmp_path):
         """Test loading a valid workflow config."""
-        config_content = """
-name: Test Workflow
-nodes:
-  count: 2
-  prefix: calimero-node
-steps:
-  - name: Wait
-    type: wait
-    seconds: 5
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write(config_content)
-            f.flush()
-            try:
-                config = config_module.load_workflow_config(f.name)
-                assert config["name"] == "Test Workflow"
-                assert config["nodes"]["count"] == 2
-                assert len(config["steps"]) == 1
-            finally:
-                os.unlink(f.name)
-
-    def test_load_invalid_config_raises_error(self, config_module):
+        config_file = tmp_path / "workflow.yml"
+        config_file.write_text(_VALID_YAML)
+
+        config = config_module.load_workflow_config(str(config_file))
+        assert config["name"] == "Test Workflow"
+        assert config["nodes"]["count"] == 2
+        assert len(config["steps"]) == 1
+
+    def test_load_invalid_config_raises_error(self, config_module, tmp_path):
         """Test that loading an invalid config raises ValueError."""
-        config_content = """
-name: Invalid Workflow
-nodes:
-  count: 2
-steps:
-  - name: Invalid Step
-    type: nonexistent_type
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write(config_content)
-            f.flush()
-            try:
-                with pytest.raises(ValueError) as exc_info:
-                    config_module.load_workflow_config(f.name)
-                assert "nonexistent_type" in str(exc_info.value).lower()
-            finally:
-                os.unlink(f.name)
-
-    def test_load_config_skip_schema_validation(self, config_module):
+        config_file = tmp_path / "workflow.yml"
+        config_file.write_text(_INVALID_STEP_YAML)
+
+        with pytest.raises(ValueError) as exc_info:
+            config_module.load_workflow_config(str(config_file))
+        assert "nonexistent_type" in str(exc_info.value).lower()
+
+    def test_load_config_skip_schema_validation(self, config_module, tmp_path):
         """Test loading config with schema validation skipped."""
-        config_content = """
-name: Workflow with Issues
-nodes:
-  count: 2
-steps:
-  - name: Invalid Step
-    type: nonexistent_type
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write(config_content)
-            f.flush()
-            try:
-                # Should not raise with skip_schema_validation=True
-                config = config_module.load_workflow_config(
-                    f.name, skip_schema_validation=True
-                )
-                assert config["name"] == "Workflow with Issues"
-            finally:
-                os.unlink(f.name)
+        config_file = tmp_path / "workflow.yml"
+        config_file.write_text(_INVALID_STEP_YAML)
+
+        # Should not raise with skip_schema_validation=True
+        config = config_module.load_workflow_config(
+            str(config_file), skip_schema_validation=True
+        )
+        assert config["name"] == "Workflow with Issues"
 
     def test_load_missing_file(self, config_module):
         """Test loading a non-existent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             config_module.load_workflow_config("/nonexistent/path/workflow.yml")
 
-    def test_load_invalid_yaml(self, config_module):
+    def test_load_invalid_yaml(self, config_module, tmp_path):
         """Test loading invalid YAML raises ValueError."""
-        config_content = """
-name: Test
-nodes: [
-  invalid yaml here
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write(config_content)
-            f.flush()
-            try:
-                with pytest.raises(ValueError) as exc_info:
-                    config_module.load_workflow_config(f.name)
-                assert "yaml" in str(exc_info.value).lower()
-            finally:
-                os.unlink(f.name)
+        config_file = tmp_path / "workflow.yml"
+        config_file.write_text(_MALFORMED_YAML)
+
+        with pytest.raises(ValueError) as exc_info:
+            config_module.load_workflow_config(str(config_file))
+        assert "yaml" in str(exc_info.value).lower()
 
 
 class TestValidStepTypes:
@@ -540,49 +463,8 @@ class TestValidStepTypes:
 
     def test_all_expected_types_present(self, config_module):
         """Test that all expected step types are in VALID_STEP_TYPES."""
-        expected_types = [
-            "install_application",
-            "create_context",
-            "create_namespace",
-            "create_namespace_invitation",
-            "join_namespace",
-            "create_identity",
-            # Deprecated aliases kept valid
-            "create_group",
-            "create_group_invitation",
-            "join_group",
-            "invite",
-            "invite_identity",
-            "join_context",
-            "invite_open",
-            "join",
-            "join_open",
-            "list_namespaces",
-            "get_namespace_identity",
-            "create_group_in_namespace",
-            "list_namespace_groups",
-            "reparent_group",
-            "list_subgroups",
-            "add_group_members",
-            "call",
-            "wait",
-            "wait_for_sync",
-            "repeat",
-            "parallel",
-            "script",
-            "assert",
-            "json_assert",
-            "get_proposal",
-            "list_proposals",
-            "get_proposal_approvers",
-            "upload_blob",
-            "create_mesh",
-            "fuzzy_test",
-        ]
-        for step_type in expected_types:
-            assert (
-                step_type in config_module.VALID_STEP_TYPES
-            ), f"Missing step type: {step_type}"
+        missing = _EXPECTED_STEP_TYPES - config_module.VALID_STEP_TYPES
+        assert not missing, f"Missing step types: {sorted(missing)}"
 
     def test_no_duplicate_types(self, config_module):
         """Test that there are no duplicate step types."""
@@ -594,28 +476,6 @@ class TestValidStepTypes:
 class TestStepSpecificValidation:
     """Tests for step-specific validation rules."""
 
-    def test_invite_identity_all_required_fields(self, config_module):
-        """Test invite_identity alias validates with namespace_id."""
-        step = {
-            "name": "Invite",
-            "type": "invite_identity",
-            "node": "calimero-node-1",
-            "namespace_id": "{{namespace_id}}",
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
-
-    def test_join_context_all_required_fields(self, config_module):
-        """Test join_context step (group membership) requires node and context_id."""
-        step = {
-            "name": "Join context",
-            "type": "join_context",
-            "node": "calimero-node-2",
-            "context_id": "{{context_id}}",
-        }
-        errors = config_module.validate_workflow_step(step, 0)
-        assert len(errors) == 0
-
     def test_join_invitation_all_required_fields(self, config_module):
         """Test join alias validates with namespace_id and invitation."""
         step = {
@@ -65,6 +65,7 @@ setup(
             "twine",
             "pytest",
             "pytest-asyncio",
+            "pytest-xdist",
             "black",
             "flake8",
             "mypy",